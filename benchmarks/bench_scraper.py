@@ -0,0 +1,244 @@
+"""
+Micro-benchmarks for the scraper pipeline at 50, 500 and 5000 tickers
+Times row parsing, CompanyStore upsert/latest and, when a Chrome driver is
+available, the in-browser table extraction against tests/fixtures.
+
+    python benchmarks/bench_scraper.py --output results.json
+    python benchmarks/bench_scraper.py --update-baseline
+
+Results are written as JSON. Each one is compared against
+benchmarks/baseline.json, and the exit status is 1 when any median is
+slower than its baseline by more than --tolerance. Baselines are machine
+specific: regenerate them on the machine that runs the check.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import threading
+import time
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from importlib.machinery import SourceFileLoader
+from importlib.util import module_from_spec, spec_from_loader
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from company_store import CompanyStore  # noqa: E402
+
+FIXTURES = os.path.join(ROOT, "tests", "fixtures")
+BASELINE = os.path.join(ROOT, "benchmarks", "baseline.json")
+SIZES = (50, 500, 5000)
+HEADERS = [
+    "Ticker", "Company", "Founder", "Market Cap", "YTD Return",
+    "Network Effects", "Founder Leadership", "Cramer",
+]
+
+
+def synthetic_rows(n, seed=0):
+    """Deterministic scraped cell rows for n tickers"""
+    rng = random.Random(seed)
+    return [
+        [
+            f"T{i:04d}",
+            f"Company {i}",
+            f"Founder {i}",
+            f"{rng.uniform(1, 3000):.1f}",
+            f"{rng.uniform(-50, 150):.2f}",
+            str(rng.randint(1, 10)),
+            str(rng.randint(1, 10)),
+            rng.choice(["buy", "sell", ""]),
+        ]
+        for i in range(n)
+    ]
+
+
+def next_scrape(companies, changed=0.05, seed=1):
+    """Copy of companies with prices moved for a fraction of them"""
+    rng = random.Random(seed)
+    updated = [dict(company) for company in companies]
+    for company in rng.sample(updated, max(1, int(len(updated) * changed))):
+        company["YTD Return"] = f"{rng.uniform(-50, 150):.2f}"
+        company["Market Cap"] = f"{rng.uniform(1, 3000):.1f}"
+    return updated
+
+
+def measure(fn, setup=lambda: (), repeat=5):
+    """Median and min wall time of fn(*setup()); setup is not timed"""
+    times = []
+    for _ in range(repeat):
+        args = setup()
+        start = time.perf_counter()
+        fn(*args)
+        times.append(time.perf_counter() - start)
+    return {"median_s": statistics.median(times), "min_s": min(times), "repeat": repeat}
+
+
+def load_scraper_module():
+    """Import "py scraper.txt"; None when Selenium or pandas is missing"""
+    loader = SourceFileLoader("nefl_scraper", os.path.join(ROOT, "py scraper.txt"))
+    module = module_from_spec(spec_from_loader(loader.name, loader))
+    try:
+        loader.exec_module(module)
+    except ImportError:
+        return None
+    return module
+
+
+def bench_store(n, repeat):
+    """CompanyStore write and read paths for one scrape size"""
+    first = [dict(zip(HEADERS, row)) for row in synthetic_rows(n)]
+    second = next_scrape(first)
+
+    def seeded():
+        store = CompanyStore(":memory:")
+        store.upsert(first, scraped_at="2026-01-01")
+        return (store,)
+
+    def two_scrapes():
+        (store,) = seeded()
+        store.upsert(second, scraped_at="2026-01-02")
+        return (store,)
+
+    return {
+        "store.upsert.initial": measure(
+            lambda store: store.upsert(first, scraped_at="2026-01-01"),
+            lambda: (CompanyStore(":memory:"),),
+            repeat,
+        ),
+        "store.upsert.incremental": measure(
+            lambda store: store.upsert(second, scraped_at="2026-01-02"), seeded, repeat
+        ),
+        "store.latest": measure(lambda store: store.latest(), two_scrapes, repeat),
+        "store.latest.as_of": measure(
+            lambda store: store.latest(as_of="2026-01-01T12:00"), two_scrapes, repeat
+        ),
+    }
+
+
+def bench_parse(scraper, n, repeat):
+    """rows_to_companies over extracted cell lists"""
+    rows = synthetic_rows(n)
+    return {
+        "scraper.rows_to_companies": measure(
+            lambda: scraper.rows_to_companies(HEADERS, rows), repeat=repeat
+        ),
+    }
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+def bench_extract(scraper, sizes, repeat):
+    """Bulk extraction from the virtualized grid fixture; {} without Chrome"""
+    # The scraper reports progress on stdout, which carries the JSON report
+    with contextlib.redirect_stdout(sys.stderr):
+        return _bench_extract(scraper, sizes, repeat)
+
+
+def _bench_extract(scraper, sizes, repeat):
+    instance = scraper.NEFLStocksScraper(headless=True, timeout=60, scroll_pause=0.02)
+    try:
+        instance.setup_driver()
+    except Exception as e:
+        print(f"⚠ Skipping extraction benchmarks, Chrome driver not available: {e}", file=sys.stderr)
+        return {}
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), partial(QuietHandler, directory=FIXTURES))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    results = {}
+    try:
+        for n in sizes:
+            instance.url = f"http://127.0.0.1:{server.server_address[1]}/virtual_grid.html?rows={n}&height=2000"
+            results[n] = {"scraper.extract.virtual_grid": measure(instance.scrape_companies, repeat=repeat)}
+    finally:
+        server.shutdown()
+        server.server_close()
+        instance.close()
+    return results
+
+
+def run(sizes=SIZES, repeat=5, browser=True):
+    """Run every benchmark and return a flat list of result records"""
+    scraper = load_scraper_module()
+    if scraper is None:
+        print("⚠ Skipping scraper benchmarks, Selenium or pandas not installed", file=sys.stderr)
+
+    extract = bench_extract(scraper, sizes, max(1, repeat // 2)) if scraper and browser else {}
+    results = []
+    for n in sizes:
+        timings = bench_store(n, repeat)
+        if scraper:
+            timings.update(bench_parse(scraper, n, repeat))
+        timings.update(extract.get(n, {}))
+        results.extend({"name": name, "tickers": n, **stats} for name, stats in timings.items())
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Return the results whose median regressed past the baseline"""
+    expected = {(r["name"], r["tickers"]): r["median_s"] for r in baseline.get("results", [])}
+    regressions = []
+    for result in results:
+        reference = expected.get((result["name"], result["tickers"]))
+        if reference is not None and result["median_s"] > reference * (1 + tolerance):
+            regressions.append({**result, "baseline_median_s": reference})
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="write results JSON here instead of stdout")
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument("--tolerance", type=float, default=0.5,
+                        help="allowed slowdown over the baseline median (0.5 = 50%%)")
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--no-browser", action="store_true", help="skip Chrome extraction benchmarks")
+    args = parser.parse_args(argv)
+
+    report = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": run(args.sizes, args.repeat, browser=not args.no_browser),
+    }
+
+    if args.update_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"✓ Wrote baseline to {args.baseline}", file=sys.stderr)
+        return 0
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    report["regressions"] = compare(report["results"], baseline, args.tolerance)
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+    else:
+        print(output)
+
+    for r in report["regressions"]:
+        print(
+            f"✗ {r['name']} @ {r['tickers']} tickers: {r['median_s']:.4f}s "
+            f"vs baseline {r['baseline_median_s']:.4f}s",
+            file=sys.stderr,
+        )
+    return 1 if report["regressions"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
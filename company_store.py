@@ -0,0 +1,188 @@
+"""
+Versioned store for scraped founder-led company data
+Upserts rows by ticker into one SQLite file and records only changed fields
+"""
+
+import json
+import sqlite3
+from datetime import date, datetime
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS company_fields (
+    ticker TEXT NOT NULL,
+    field TEXT NOT NULL,
+    value TEXT,
+    deleted INTEGER NOT NULL DEFAULT 0,
+    scraped_at TEXT NOT NULL,
+    PRIMARY KEY (ticker, field, scraped_at)
+);
+CREATE TABLE IF NOT EXISTS company_latest (
+    ticker TEXT NOT NULL,
+    field TEXT NOT NULL,
+    value TEXT,
+    scraped_at TEXT NOT NULL,
+    PRIMARY KEY (ticker, field)
+);
+CREATE TABLE IF NOT EXISTS layouts (
+    scraped_at TEXT PRIMARY KEY,
+    tickers TEXT NOT NULL,
+    columns TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS last_scrape (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    scraped_at TEXT NOT NULL
+);
+"""
+
+TICKER_COLUMNS = ("ticker", "symbol")
+
+
+def _timestamp(value):
+    """Normalize a datetime, date or ISO string to a sortable ISO string
+
+    Date-only values (e.g. "2026-01-01") mean midnight at the start of that day.
+    """
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    elif isinstance(value, date) and not isinstance(value, datetime):
+        value = datetime.combine(value, datetime.min.time())
+    return value.isoformat(timespec="microseconds")
+
+
+def _ticker_column(company):
+    """Pick the column that identifies a company row"""
+    for column in company:
+        if column.strip().lower() in TICKER_COLUMNS:
+            return column
+    return next(iter(company))
+
+
+class CompanyStore:
+    def __init__(self, path="founder_led_companies.db"):
+        """Open (or create) the store at path"""
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(SCHEMA)
+
+    def upsert(self, companies, scraped_at=None, key=None):
+        """Record the fields that changed since the last scrape
+
+        Each call is treated as a complete scrape: tickers and fields that
+        are no longer present get a tombstone (NULL value, deleted = 1).
+        company_fields keeps every version of a field keyed by scrape time;
+        company_latest holds the current live value so the common read is a
+        single table scan; layouts records the row and column order only
+        when it differs from the previous scrape. A scrape with no usable
+        ticker is ignored rather than deleting everything, and scraped_at
+        must not be older than the newest stored scrape (ValueError).
+        Returns the number of fields written, tombstones included.
+        """
+        if not companies:
+            return 0
+
+        scraped_at = _timestamp(scraped_at or datetime.now())
+        last = self.conn.execute("SELECT scraped_at FROM last_scrape").fetchone()
+        if last and scraped_at < last[0]:
+            raise ValueError(
+                f"scraped_at {scraped_at} is older than the newest stored scrape {last[0]}"
+            )
+
+        key = key or _ticker_column(companies[0])
+        current = {}
+        for ticker, field, value in self.conn.execute(
+            "SELECT ticker, field, value FROM company_latest"
+        ):
+            current.setdefault(ticker, {})[field] = value
+
+        scraped = {}
+        columns = {}
+        for company in companies:
+            ticker = company.get(key)
+            if not ticker:
+                continue
+            scraped[ticker] = company
+            columns.update(dict.fromkeys(company))
+        if not scraped:
+            return 0
+
+        changes = []
+        removed = []
+        for ticker, company in scraped.items():
+            previous = current.get(ticker, {})
+            for field, value in company.items():
+                value = None if value is None else str(value)
+                if field in previous and previous[field] == value:
+                    continue
+                changes.append((ticker, field, value, 0, scraped_at))
+            removed.extend((ticker, field) for field in previous if field not in company)
+        for ticker, previous in current.items():
+            if ticker not in scraped:
+                removed.extend((ticker, field) for field in previous)
+
+        layout = (json.dumps(list(scraped)), json.dumps(list(columns)))
+        previous_layout = self.conn.execute(
+            "SELECT tickers, columns FROM layouts ORDER BY scraped_at DESC LIMIT 1"
+        ).fetchone()
+
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO company_fields VALUES (?, ?, ?, ?, ?)",
+                changes + [(ticker, field, None, 1, scraped_at) for ticker, field in removed],
+            )
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO company_latest VALUES (?, ?, ?, ?)",
+                [(ticker, field, value, at) for ticker, field, value, _, at in changes],
+            )
+            self.conn.executemany(
+                "DELETE FROM company_latest WHERE ticker = ? AND field = ?", removed
+            )
+            if previous_layout != layout:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO layouts VALUES (?, ?, ?)", (scraped_at, *layout)
+                )
+            self.conn.execute("INSERT OR REPLACE INTO last_scrape VALUES (0, ?)", (scraped_at,))
+        return len(changes) + len(removed)
+
+    def latest(self, as_of=None):
+        """Return one dict per company as it looked at as_of (default: now)
+
+        as_of accepts a datetime, a date or an ISO string. Companies come back
+        in the row order of the newest layout at or before as_of, with keys in
+        column order.
+        """
+        if as_of is None:
+            cursor = self.conn.execute("SELECT ticker, field, value FROM company_latest")
+            layout = self.conn.execute(
+                "SELECT tickers, columns FROM layouts ORDER BY scraped_at DESC LIMIT 1"
+            ).fetchone()
+        else:
+            as_of = _timestamp(as_of)
+            # SQLite returns the bare columns from the row holding MAX(scraped_at)
+            cursor = self.conn.execute(
+                "SELECT ticker, field, value FROM ("
+                "SELECT ticker, field, value, deleted, MAX(scraped_at) FROM company_fields "
+                "WHERE scraped_at <= ? GROUP BY ticker, field"
+                ") WHERE deleted = 0",
+                (as_of,),
+            )
+            layout = self.conn.execute(
+                "SELECT tickers, columns FROM layouts WHERE scraped_at <= ? "
+                "ORDER BY scraped_at DESC LIMIT 1",
+                (as_of,),
+            ).fetchone()
+
+        fields = {}
+        for ticker, field, value in cursor:
+            fields.setdefault(ticker, {})[field] = value
+
+        tickers, columns = (json.loads(part) for part in layout) if layout else ([], [])
+        tickers = [t for t in tickers if t in fields] + sorted(set(fields) - set(tickers))
+        position = {column: i for i, column in enumerate(columns)}
+        return [
+            dict(sorted(fields[t].items(), key=lambda item: position.get(item[0], len(position))))
+            for t in tickers
+        ]
+
+    def close(self):
+        """Close the underlying database connection"""
+        self.conn.close()
@@ -59,7 +59,7 @@
     </div>
 
     <script type="text/babel">
-        const { useState, useEffect, useMemo } = React;
+        const { useState, useEffect, useMemo, useRef } = React;
 
         // API service
         const API_BASE_URL = 'https://founder-led-api-production.up.railway.app/api';
@@ -74,15 +74,22 @@
             const [networkEffects, setNetworkEffects] = useState(1);
             const [founderLeadership, setFounderLeadership] = useState(1);
             const [selectedCompany, setSelectedCompany] = useState(null);
+            // Requests still in flight, so a tab click doesn't duplicate the mount fetch
+            const inFlight = useRef({});
 
+            // Load every tab's data once, in parallel, and reuse it across tab switches;
+            // the tab buttons refetch only while that data is still missing
             useEffect(() => {
                 fetchData();
+                fetchInverseCramer();
+                fetchTopSeven();
             }, []);
 
             const fetchData = async () => {
                 setLoading(true);
                 try {
                     const response = await fetch(`${API_BASE_URL}/companies`);
+                    if (!response.ok) throw new Error(`HTTP ${response.status}`);
                     const data = await response.json();
                     setCompanies(data);
                 } catch (error) {
@@ -94,6 +101,7 @@
             const fetchTopTwenty = async () => {
                 try {
                     const response = await fetch(`${API_BASE_URL}/top-twenty`);
+                    if (!response.ok) throw new Error(`HTTP ${response.status}`);
                     const data = await response.json();
                     setTopTwenty(data);
                 } catch (error) {
@@ -102,22 +110,32 @@
             };
 
             const fetchTopSeven = async () => {
+                if (inFlight.current.topSeven) return;
+                inFlight.current.topSeven = true;
                 try {
                     const response = await fetch(`${API_BASE_URL}/top-seven`);
+                    if (!response.ok) throw new Error(`HTTP ${response.status}`);
                     const data = await response.json();
                     setTopSeven(data);
                 } catch (error) {
                     console.error('Error:', error);
+                } finally {
+                    inFlight.current.topSeven = false;
                 }
             };
 
             const fetchInverseCramer = async () => {
+                if (inFlight.current.inverseCramer) return;
+                inFlight.current.inverseCramer = true;
                 try {
                     const response = await fetch(`${API_BASE_URL}/inverse-cramer`);
+                    if (!response.ok) throw new Error(`HTTP ${response.status}`);
                     const data = await response.json();
                     setInverseCramer(data);
                 } catch (error) {
                     console.error('Error:', error);
+                } finally {
+                    inFlight.current.inverseCramer = false;
                 }
             };
 
@@ -161,13 +179,13 @@
                                 Founder-Led Strategy
                             </button>
                             <button
-                                onClick={() => { setSelectedTab(1); fetchInverseCramer(); }}
+                                onClick={() => { setSelectedTab(1); if (!inverseCramer) fetchInverseCramer(); }}
                                 className={`px-6 py-3 rounded-lg font-semibold transition ${selectedTab === 1 ? 'bg-white text-red-600 shadow' : 'bg-white/50 text-gray-600'}`}
                             >
                                 📺 Inverse Cramer
                             </button>
                             <button
-                                onClick={() => { setSelectedTab(2); fetchTopSeven(); }}
+                                onClick={() => { setSelectedTab(2); if (topSeven.length === 0) fetchTopSeven(); }}
                                 className={`px-6 py-3 rounded-lg font-semibold transition ${selectedTab === 2 ? 'bg-white text-green-600 shadow' : 'bg-white/50 text-gray-600'}`}
                             >
                                 🏆 Top Seven
@@ -410,28 +428,10 @@
             document.getElementById('installPrompt').classList.remove('show');
         }
 
-        // Service Worker for offline support
+        // Service Worker for offline support (sw.js, served from this origin)
         if ('serviceWorker' in navigator) {
             window.addEventListener('load', () => {
-                const swCode = `
-                    self.addEventListener('install', (e) => {
-                        e.waitUntil(
-                            caches.open('founder-led-v1').then((cache) => {
-                                return cache.addAll(['/']);
-                            })
-                        );
-                    });
-                    self.addEventListener('fetch', (e) => {
-                        e.respondWith(
-                            caches.match(e.request).then((response) => {
-                                return response || fetch(e.request);
-                            })
-                        );
-                    });
-                `;
-                const blob = new Blob([swCode], { type: 'application/javascript' });
-                const swUrl = URL.createObjectURL(blob);
-                navigator.serviceWorker.register(swUrl);
+                navigator.serviceWorker.register('/sw.js');
             });
         }
     </script>
@@ -0,0 +1,67 @@
+// Service worker for offline support.
+// Must be served from the same origin as the page (e.g. /sw.js); browsers
+// refuse to register workers from blob: or cross-origin URLs.
+//
+// Network-first with revalidation: the browser sends If-None-Match so
+// unchanged snapshots come back as 304s. For navigations and static assets,
+// if the network has not answered within NETWORK_TIMEOUT_MS a cached copy is
+// served instead (when there is one) while the request keeps running and
+// refreshes the cache. /api/ requests only use the cache when offline.
+// Bump CACHE_VERSION to drop old caches.
+const CACHE_VERSION = 'founder-led-v2';
+const NETWORK_TIMEOUT_MS = 4000;
+
+self.addEventListener('install', (e) => {
+    self.skipWaiting();
+    e.waitUntil(
+        caches.open(CACHE_VERSION).then((cache) => {
+            return cache.addAll(['/']);
+        })
+    );
+});
+
+self.addEventListener('activate', (e) => {
+    e.waitUntil(
+        caches.keys().then((keys) => {
+            return Promise.all(
+                keys.filter((key) => key !== CACHE_VERSION).map((key) => caches.delete(key))
+            );
+        }).then(() => self.clients.claim())
+    );
+});
+
+// API responses carry prices the page loads once per visit, so they never
+// take the timeout fallback: a cached copy is only used when offline
+const isApiRequest = (request) => new URL(request.url).pathname.startsWith('/api/');
+
+self.addEventListener('fetch', (e) => {
+    if (e.request.method !== 'GET') return;
+
+    const cached = () => caches.open(CACHE_VERSION).then((cache) => cache.match(e.request));
+    const offline = () => cached().then((response) => response || Response.error());
+
+    const network = fetch(e.request, { cache: 'no-cache' });
+    // Keep the worker alive until the cache has been refreshed, even when
+    // the page was already answered from the cache
+    e.waitUntil(
+        network.then((response) => {
+            if (!response.ok) return;
+            const copy = response.clone();
+            return caches.open(CACHE_VERSION).then((cache) => cache.put(e.request, copy));
+        }).catch(() => {})
+    );
+
+    if (isApiRequest(e.request)) {
+        e.respondWith(network.catch(offline));
+        return;
+    }
+
+    // On a slow connection fall back to the cache after the timeout,
+    // but keep waiting for the network if nothing is cached
+    let timer;
+    const timeout = new Promise((resolve) => { timer = setTimeout(resolve, NETWORK_TIMEOUT_MS); })
+        .then(cached)
+        .then((response) => response || network);
+    network.finally(() => clearTimeout(timer)).catch(() => {});
+    e.respondWith(Promise.race([network, timeout]).catch(offline));
+});
@@ -0,0 +1,27 @@
+from benchmarks.bench_scraper import compare, run
+
+
+def test_run_reports_every_store_benchmark_per_size():
+    results = run(sizes=[10, 20], repeat=1, browser=False)
+
+    names = {(r["name"], r["tickers"]) for r in results}
+    for n in (10, 20):
+        for name in ("store.upsert.initial", "store.upsert.incremental", "store.latest", "store.latest.as_of"):
+            assert (name, n) in names
+    assert all(r["median_s"] >= 0 for r in results)
+
+
+def test_compare_flags_only_slowdowns_past_tolerance():
+    baseline = {"results": [
+        {"name": "a", "tickers": 50, "median_s": 1.0},
+        {"name": "b", "tickers": 50, "median_s": 1.0},
+    ]}
+    results = [
+        {"name": "a", "tickers": 50, "median_s": 1.4},
+        {"name": "b", "tickers": 50, "median_s": 1.6},
+        {"name": "c", "tickers": 50, "median_s": 9.0},
+    ]
+
+    regressions = compare(results, baseline, tolerance=0.5)
+
+    assert [(r["name"], r["baseline_median_s"]) for r in regressions] == [("b", 1.0)]
@@ -0,0 +1,115 @@
+from datetime import date, datetime
+
+import pytest
+
+from company_store import CompanyStore
+
+
+@pytest.fixture
+def store():
+    store = CompanyStore(":memory:")
+    yield store
+    store.close()
+
+
+def test_upsert_records_only_changed_fields(store):
+    first = [{"Ticker": "A", "Price": "1", "X": "x"}, {"Ticker": "B", "Price": "2", "X": "y"}]
+    assert store.upsert(first, scraped_at="2026-01-01T00:00") == 6
+
+    second = [{"Ticker": "A", "Price": "3", "X": "x"}, {"Ticker": "B", "Price": "2", "X": "y"}]
+    assert store.upsert(second, scraped_at="2026-01-02T00:00") == 1
+
+    assert store.latest() == second
+
+
+def test_removed_tickers_and_fields_are_tombstoned(store):
+    store.upsert(
+        [{"Ticker": "A", "Price": "1", "X": "x"}, {"Ticker": "B", "Price": "2", "X": "y"}],
+        scraped_at="2026-01-01T00:00",
+    )
+    # B left the list (3 tombstones), A lost column X (1 tombstone), A's price changed
+    assert store.upsert([{"Ticker": "A", "Price": "3"}], scraped_at="2026-01-02T00:00") == 5
+
+    assert store.latest() == [{"Ticker": "A", "Price": "3"}]
+    assert store.latest(as_of="2026-01-03") == [{"Ticker": "A", "Price": "3"}]
+    assert store.latest(as_of="2026-01-01T12:00") == [
+        {"Ticker": "A", "Price": "1", "X": "x"},
+        {"Ticker": "B", "Price": "2", "X": "y"},
+    ]
+
+
+def test_returning_ticker_is_live_again(store):
+    store.upsert([{"Ticker": "A", "Price": "1"}, {"Ticker": "B", "Price": "2"}], scraped_at="2026-01-01")
+    store.upsert([{"Ticker": "A", "Price": "1"}], scraped_at="2026-01-02")
+    store.upsert([{"Ticker": "A", "Price": "1"}, {"Ticker": "B", "Price": "2"}], scraped_at="2026-01-03")
+
+    assert store.latest() == [{"Ticker": "A", "Price": "1"}, {"Ticker": "B", "Price": "2"}]
+    assert store.latest(as_of="2026-01-02") == [{"Ticker": "A", "Price": "1"}]
+
+
+def test_latest_keeps_scrape_row_and_column_order(store):
+    store.upsert(
+        [{"Ticker": "ZM", "Rank": "1", "Founder": "Yuan"}, {"Ticker": "AAPL", "Rank": "2", "Founder": "Jobs"}],
+        scraped_at="2026-01-01T00:00",
+    )
+    store.upsert(
+        [{"Ticker": "AAPL", "Rank": "1", "Founder": "Jobs"}, {"Ticker": "ZM", "Rank": "2", "Founder": "Yuan"}],
+        scraped_at="2026-01-02T00:00",
+    )
+
+    latest = store.latest()
+    assert [c["Ticker"] for c in latest] == ["AAPL", "ZM"]
+    assert list(latest[0]) == ["Ticker", "Rank", "Founder"]
+    assert [c["Ticker"] for c in store.latest(as_of="2026-01-01T12:00")] == ["ZM", "AAPL"]
+
+
+@pytest.mark.parametrize(
+    "as_of", ["2026-01-01", "2026-01-01T00:00", date(2026, 1, 1), datetime(2026, 1, 1)]
+)
+def test_as_of_accepts_dates_and_partial_timestamps(store, as_of):
+    store.upsert([{"Ticker": "A", "Price": "1"}], scraped_at=datetime(2026, 1, 1))
+
+    assert store.latest(as_of=as_of) == [{"Ticker": "A", "Price": "1"}]
+    assert store.latest(as_of="2025-12-31T23:59:59") == []
+
+
+def test_empty_scrape_is_ignored(store):
+    store.upsert([{"Ticker": "A", "Price": "1"}], scraped_at="2026-01-01")
+
+    assert store.upsert([], scraped_at="2026-01-02") == 0
+    assert store.latest() == [{"Ticker": "A", "Price": "1"}]
+
+
+def test_scrape_without_usable_tickers_is_ignored(store):
+    store.upsert([{"Ticker": "A", "P": "1"}, {"Ticker": "B", "P": "2"}], scraped_at="2026-01-01")
+
+    assert store.upsert([{"Ticker": "", "P": "1"}], scraped_at="2026-01-02") == 0
+    assert store.latest() == [{"Ticker": "A", "P": "1"}, {"Ticker": "B", "P": "2"}]
+
+
+def test_out_of_order_scrape_is_rejected(store):
+    store.upsert([{"Ticker": "A", "P": "1"}], scraped_at="2026-01-02")
+
+    with pytest.raises(ValueError):
+        store.upsert([{"Ticker": "A", "P": "0"}], scraped_at="2026-01-01")
+
+    assert store.latest() == [{"Ticker": "A", "P": "1"}]
+    assert store.latest(as_of="2026-01-03") == store.latest()
+    # A later scrape with no changed fields still moves the high-water mark
+    store.upsert([{"Ticker": "A", "P": "1"}], scraped_at="2026-01-05")
+    with pytest.raises(ValueError):
+        store.upsert([{"Ticker": "A", "P": "2"}], scraped_at="2026-01-04")
+
+
+def test_layout_is_only_written_when_it_changes(store):
+    rows = [{"Ticker": "A", "P": "1"}, {"Ticker": "B", "P": "2"}]
+    store.upsert(rows, scraped_at="2026-01-01")
+    store.upsert(rows, scraped_at="2026-01-02")
+    store.upsert([{"Ticker": "A", "P": "5"}, {"Ticker": "B", "P": "2"}], scraped_at="2026-01-03")
+    assert store.conn.execute("SELECT COUNT(*) FROM layouts").fetchone() == (1,)
+
+    store.upsert(rows[::-1], scraped_at="2026-01-04")
+    assert store.conn.execute("SELECT COUNT(*) FROM layouts").fetchone() == (2,)
+
+    assert [c["Ticker"] for c in store.latest(as_of="2026-01-03T12:00")] == ["A", "B"]
+    assert [c["Ticker"] for c in store.latest()] == ["B", "A"]
@@ -0,0 +1,83 @@
+"""
+Runs NEFLStocksScraper against saved pages served from a local HTTP server
+Skipped when Selenium, pandas or a Chrome driver is not available
+"""
+
+import os
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from importlib.machinery import SourceFileLoader
+from importlib.util import module_from_spec, spec_from_loader
+
+import pytest
+
+pytest.importorskip("selenium")
+pytest.importorskip("pandas")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES = os.path.join(ROOT, "tests", "fixtures")
+
+
+def load_scraper_module():
+    """Import "py scraper.txt", which is not a regular module name"""
+    loader = SourceFileLoader("nefl_scraper", os.path.join(ROOT, "py scraper.txt"))
+    module = module_from_spec(spec_from_loader(loader.name, loader))
+    loader.exec_module(module)
+    return module
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def base_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), partial(QuietHandler, directory=FIXTURES))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(scope="module")
+def scraper():
+    module = load_scraper_module()
+    scraper = module.NEFLStocksScraper(headless=True, timeout=10, scroll_pause=0.05)
+    try:
+        scraper.setup_driver()
+    except Exception as e:
+        pytest.skip(f"Chrome driver not available: {e}")
+    yield scraper
+    scraper.close()
+
+
+@pytest.mark.parametrize("bulk", [True, False])
+def test_plain_table_skips_layout_table_and_empty_rows(scraper, base_url, bulk):
+    scraper.url = f"{base_url}/plain_table.html"
+    scraper.bulk = bulk
+
+    companies = scraper.scrape_companies()
+
+    assert companies == [
+        {"Ticker": "NVDA", "Company": "NVIDIA", "Founder": "Jensen Huang"},
+        {"Ticker": "META", "Company": "Meta Platforms", "Founder": "Mark Zuckerberg"},
+        {"Ticker": "AMZN", "Company": "Amazon", "Founder": "Jeff Bezos"},
+    ]
+
+
+def test_virtualized_grid_is_paged_in_both_directions(scraper, base_url):
+    scraper.url = f"{base_url}/virtual_grid.html"
+    scraper.bulk = True
+
+    companies = scraper.scrape_companies()
+
+    assert len(companies) == 60
+    assert [c["Ticker"] for c in companies] == [f"T{r}" for r in range(60)]
+    assert list(companies[0]) == [
+        "Ticker", "Company", "Founder", "Sector", "Market Cap", "YTD",
+        "Network Effects", "Founder Leadership",
+    ]
+    assert companies[59]["Founder Leadership"] == "r59c7"